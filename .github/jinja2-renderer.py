@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Render a Jinja2 template from stdin to stdout.
+
+Thin filter for shell pipelines: the template comes in on stdin, the
+rendered output leaves on stdout, and the process environment is exposed
+to the template as `env`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import stat
+import sys
+
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
+
+
+def _bytecode_cache() -> FileSystemBytecodeCache:
+    directory = os.environ.get("JINJA_CACHE_DIR")
+    if not directory:
+        # Jinja2's default cache directory is per-user, mode 0o700 and
+        # ownership-checked — a fixed shared path under $TMPDIR would let
+        # another local user pre-create it and plant bytecode that gets
+        # unmarshalled (the CVE-2014-1402 vector).
+        return FileSystemBytecodeCache()
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    st = os.stat(directory)
+    if st.st_uid != os.getuid() or stat.S_IMODE(st.st_mode) & 0o077:
+        raise RuntimeError(
+            f"Refusing bytecode cache directory '{directory}': "
+            "it must be owned by the current user and not group/world accessible"
+        )
+    return FileSystemBytecodeCache(directory=directory)
+
+
+def main() -> int:
+    # One bulk read off the raw buffer: a single read syscall loop plus one
+    # decode, instead of TextIOWrapper's line-buffered re-reads, and exactly
+    # one in-memory copy of the template source.
+    data = sys.stdin.buffer.read()
+    source = data.decode("utf-8")
+
+    # The bytecode cache keys on the template name, so the template is named
+    # after its content hash: when a calling script pipes the same template
+    # through repeatedly, every run after the first skips lex/parse/compile
+    # (the dominant cost for small templates) and loads compiled bytecode
+    # from disk instead. from_string() would bypass the cache, hence the
+    # one-entry loader.
+    name = hashlib.blake2b(data, digest_size=16).hexdigest()
+    env = Environment(
+        loader=DictLoader({name: source}),
+        bytecode_cache=_bytecode_cache(),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+    )
+    template = env.get_template(name)
+
+    # Stream the render: blocks hit stdout as they are produced, so peak
+    # memory stays bounded by one block instead of the whole document (and
+    # nothing appends a stray trailing newline the way print() would).
+    template.stream(env=os.environ).dump(sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""Enforce naming and description policies on `dev-fork` repositories.
+
+This is the importable implementation; the file under `.github/workflows/`
+is only a thin entry point around :func:`main`.
+
+Finds every fork of mine tagged with the `dev-fork` topic and makes sure it
+follows the house rules:
+
+  - the repository description starts with the ``[DEV-FORK]`` tag and names
+    the parent repository,
+  - the repository name matches the parent repository's name.
+
+All reads go through a single paginated GraphQL search which inlines the
+parent repository data (`parent { name owner { login } }`), so the whole
+discovery pass costs ceil(N/100) HTTP requests instead of the ~2N+1 REST
+round-trips a naive search + per-repo parent dereference would take.
+Writes use the `updateRepository` mutation with the node id returned by the
+search, and only fire when a field actually differs.
+
+Requires a ``GH_TOKEN`` environment variable with `repo` scope.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Iterator
+
+if TYPE_CHECKING:
+    import httpx
+
+# GitHub's documented node limit for aliased mutations per document.
+MUTATION_BATCH_SIZE = 20
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Deliberately un-narrowed: prefiltering on -description:"[DEV-FORK]" would
+# permanently hide repos whose description already carries the tag but whose
+# name (or the description's parent slug) has since drifted, making the name
+# policy unenforceable for them. The full pass costs one request per 100
+# repos, so there is nothing worth narrowing away.
+SEARCH_QUERY = "user:@me fork:true topic:dev-fork"
+
+DESCRIPTION_TAG = "[DEV-FORK]"
+
+_SEARCH_DOCUMENT = """
+query($searchQuery: String!, $cursor: String) {
+  search(query: $searchQuery, type: REPOSITORY, first: 100, after: $cursor) {
+    pageInfo { endCursor hasNextPage }
+    nodes {
+      ... on Repository {
+        id
+        name
+        description
+        parent { name owner { login } }
+      }
+    }
+  }
+}
+"""
+
+_UPDATE_DOCUMENT = """
+mutation($input: UpdateRepositoryInput!) {
+  updateRepository(input: $input) { repository { id } }
+}
+"""
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Simple thread-safe rate limiter keeping us under GitHub's API limits."""
+
+    def __init__(self, requests_per_minute: int) -> None:
+        self._interval = 60.0 / requests_per_minute
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(self._next_slot, now) + self._interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+# The Search API is limited to 30 requests/minute; mutations share the core
+# limit. Requests run sequentially these days, so the bucket just spaces
+# them out.
+_throttle = TokenBucket(requests_per_minute=30)
+
+
+class CustomFormatter(logging.Formatter):
+    """Colorized console formatter with per-level colors and ms timestamps."""
+
+    GREY = "\x1b[38;20m"
+    BLUE = "\x1b[34;20m"
+    YELLOW = "\x1b[33;20m"
+    RED = "\x1b[31;20m"
+    BOLD_RED = "\x1b[31;1m"
+    RESET = "\x1b[0m"
+
+    COLORS = {
+        logging.DEBUG: GREY,
+        logging.INFO: BLUE,
+        logging.WARNING: YELLOW,
+        logging.ERROR: RED,
+        logging.CRITICAL: BOLD_RED,
+    }
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Colors and layout are immutable, so bake one Formatter per level up
+        # front instead of building a format string per record.
+        self._formatters = {
+            level: logging.Formatter(
+                f"%(asctime)s {color}%(levelname)-8s{self.RESET} %(message)s"
+            )
+            for level, color in self.COLORS.items()
+        }
+        for formatter in self._formatters.values():
+            formatter.formatTime = self._format_time  # type: ignore[method-assign]
+        self._default_formatter = self._formatters[logging.DEBUG]
+
+    @staticmethod
+    def _format_time(record: logging.LogRecord, datefmt: str | None = None) -> str:
+        seconds, fraction = divmod(record.created, 1)
+        seconds = int(seconds)
+        return (
+            f"{seconds % 86400 // 3600:02d}"
+            f":{seconds % 3600 // 60:02d}"
+            f":{seconds % 60:02d}"
+            f".{int(fraction * 1000):03d}"
+        )
+
+    def format(self, record: logging.LogRecord) -> str:
+        return self._formatters.get(record.levelno, self._default_formatter).format(record)
+
+
+def graphql(
+    client: httpx.Client, document: str, variables: dict[str, Any]
+) -> dict[str, Any]:
+    # No conditional-request / ETag handling here on purpose: GitHub's
+    # GraphQL endpoint does not return ETags on POST responses, so there is
+    # nothing to revalidate against (unlike the REST endpoints).
+    _throttle.acquire()
+    response = client.post(GRAPHQL_URL, json={"query": document, "variables": variables})
+    response.raise_for_status()
+    payload = response.json()
+    if payload.get("errors"):
+        raise RuntimeError(f"GraphQL query failed: {payload['errors']}")
+    data: dict[str, Any] = payload["data"]
+    return data
+
+
+def search_dev_forks(client: httpx.Client) -> Iterator[dict[str, Any]]:
+    """Yield all matching fork nodes, walking the search cursor."""
+    cursor: str | None = None
+    while True:
+        data = graphql(
+            client, _SEARCH_DOCUMENT, {"searchQuery": SEARCH_QUERY, "cursor": cursor}
+        )
+        search = data["search"]
+        yield from search["nodes"]
+        page_info = search["pageInfo"]
+        if not page_info["hasNextPage"]:
+            break
+        cursor = page_info["endCursor"]
+
+
+def plan_repository_updates(repo: dict[str, Any]) -> dict[str, str] | None:
+    """Return the `updateRepository` input for a repo, or None if it conforms."""
+    parent = repo.get("parent")
+    if not parent:
+        logger.warning("Repo '%s' has no parent, skipping", repo["name"])
+        return None
+
+    parent_owner = parent["owner"]["login"]
+    parent_name = parent["name"]
+
+    expected_name = parent_name
+    expected_description = f"{DESCRIPTION_TAG} Development fork of {parent_owner}/{parent_name}"
+
+    updates: dict[str, str] = {}
+    if repo["name"] != expected_name:
+        logger.info("Renaming '%s' -> '%s'", repo["name"], expected_name)
+        updates["name"] = expected_name
+    if (repo.get("description") or "") != expected_description:
+        logger.info("Updating description of '%s'", repo["name"])
+        updates["description"] = expected_description
+
+    if not updates:
+        logger.debug("Repo '%s' already conforms, nothing to do", repo["name"])
+        return None
+
+    return {"repositoryId": repo["id"], **updates}
+
+
+def apply_updates(client: httpx.Client, plans: list[dict[str, str]]) -> None:
+    """Apply all planned updates, batched as aliased mutations.
+
+    GitHub allows multiple mutations per document, so up to
+    ``MUTATION_BATCH_SIZE`` updates collapse into one HTTP round trip. A
+    failing batch falls back to per-repo mutations so one bad input can't
+    sink its whole batch.
+    """
+    for start in range(0, len(plans), MUTATION_BATCH_SIZE):
+        batch = plans[start : start + MUTATION_BATCH_SIZE]
+        variable_defs = ", ".join(f"$i{k}: UpdateRepositoryInput!" for k in range(len(batch)))
+        fields = " ".join(
+            f"r{k}: updateRepository(input: $i{k}) {{ repository {{ id }} }}"
+            for k in range(len(batch))
+        )
+        document = f"mutation({variable_defs}) {{ {fields} }}"
+        variables = {f"i{k}": plan for k, plan in enumerate(batch)}
+        try:
+            graphql(client, document, variables)
+        except RuntimeError as err:
+            logger.warning("Batched update failed (%s), retrying per repo", err)
+            for plan in batch:
+                try:
+                    graphql(client, _UPDATE_DOCUMENT, {"input": plan})
+                except RuntimeError as single_err:
+                    logger.error("Update of '%s' failed: %s", plan["repositoryId"], single_err)
+
+
+def main(token: str | None = None) -> int:
+    handler = logging.StreamHandler()
+    handler.setFormatter(CustomFormatter())
+    logging.basicConfig(level=logging.INFO, handlers=[handler])
+
+    token = token or os.environ.get("GH_TOKEN")
+    if not token:
+        logger.error("GH_TOKEN environment variable is not set")
+        return 1
+
+    # Imported here so argument/env errors above don't pay the import cost.
+    import httpx
+
+    # Default connection limits: requests are sequential, so one kept-alive
+    # connection is all this client ever uses.
+    with httpx.Client(
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+        },
+    ) as client:
+        # Planning is pure dict work; the happy path for the whole run is one
+        # search request plus ceil(N/20) batched mutation requests.
+        plans = [plan for repo in search_dev_forks(client) if (plan := plan_repository_updates(repo))]
+        apply_updates(client, plans)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,662 @@
+#!/usr/bin/env python3
+"""Keep `.github/workflows` in sync with the organized `Workflows/` tree.
+
+GitHub only picks up workflow files that sit flat inside `.github/workflows`,
+which turns into an unreadable pile once there are more than a handful of
+them. This repo instead organizes workflows as a nested tree under
+`Workflows/`, where each leaf directory holds a `workflow.yml` symlink
+pointing back at the real (flat) file in `.github/workflows`.
+
+This script enforces the mapping between the two:
+
+  - `Workflows/<a>/<b>/workflow.yml` links to `.github/workflows/a--b.yml`,
+  - the workflow's YAML `name:` is the slash-joined subpath (`a/b`),
+  - flat files without a link get one created,
+  - flat files that map to nothing get removed.
+
+Run from anywhere inside the repo; it chdirs to the git root first.
+"""
+
+from __future__ import annotations
+
+import difflib
+import functools
+import json
+import os
+import re
+import stat
+import string
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Iterator
+
+from loguru import logger
+
+try:
+    from cdifflib import CSequenceMatcher
+
+    # unified_diff drives SequenceMatcher through the difflib module global,
+    # so the C implementation slots straight into the debug-diff fallback
+    # when it happens to be installed. Pure-python difflib otherwise.
+    difflib.SequenceMatcher = CSequenceMatcher  # type: ignore[misc]
+except ImportError:
+    pass
+
+GITHUB_WORKFLOWS_DIR_STR = ".github/workflows"
+# Pure variants: these constants only ever feed string-level path math;
+# concrete Paths (with their OS-dispatched flavour logic) are built at the
+# few remaining pathlib I/O call sites.
+GITHUB_WORKFLOWS_DIR = PurePosixPath(GITHUB_WORKFLOWS_DIR_STR)
+MY_WORKFLOWS_DIR = PurePosixPath("Workflows")
+
+PREVENT_UNLINK_UNRECOGNIZED_WORKFLOW_FILES = bool(
+    os.environ.get("PREVENT_UNLINK_UNRECOGNIZED_WORKFLOW_FILES")
+)
+
+_NAME_RE = re.compile(rb"^(name:)[ \t]*(.*)", re.MULTILINE)
+
+# Loguru builds the full record (frame introspection included) before the
+# sink gets to filter it, so the per-link "Processing" chatter costs real
+# time even on quiet runs. Probe the configured minimum level once and gate
+# the call sites on it.
+_INFO_ENABLED = logger._core.min_level <= logger.level("INFO").no
+
+# Flat filename parts: word chars, dots and dashes inside; no dot/dash at
+# either edge. Checked via set membership — for this charset shape that's
+# several times faster than dispatching into the regex engine per part.
+_WF_FILENAME_CHARS = frozenset(string.ascii_letters + string.digits + "_.-")
+_WF_FILENAME_EDGE_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+
+# The same rule over a whole slash-joined subpath, anchored, so the common
+# all-valid case is settled by one C-level regex call instead of a Python
+# loop over the parts.
+_WF_NAME_NORM_RE = re.compile(
+    r"[A-Za-z0-9_](?:[A-Za-z0-9_.-]*[A-Za-z0-9_])?"
+    r"(?:/[A-Za-z0-9_](?:[A-Za-z0-9_.-]*[A-Za-z0-9_])?)*\Z"
+)
+
+
+class KnownGoodNameCache:
+    """Skips re-reading workflow files whose `name:` was verified before.
+
+    Entries map ``"<st_ino>:<st_mtime_ns>"`` of the flat workflow file to the
+    name it was last confirmed (or rewritten) to carry. On an unmodified file
+    a cache hit turns the whole name check into a single stat. The cache
+    lives next to the workflow files and is persisted once per run.
+    """
+
+    PATH = os.path.join(GITHUB_WORKFLOWS_DIR_STR, ".wf-cache.json")
+
+    def __init__(self) -> None:
+        try:
+            with open(self.PATH) as f:
+                self._entries: dict[str, str] = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+        self._dirty = False
+
+    @staticmethod
+    def _key(st: os.stat_result) -> str:
+        return f"{st.st_ino}:{st.st_mtime_ns}"
+
+    def hit(self, st: os.stat_result, wf_name: str) -> bool:
+        return self._entries.get(self._key(st)) == wf_name
+
+    def record(self, st: os.stat_result, wf_name: str) -> None:
+        self._entries[self._key(st)] = wf_name
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            with open(self.PATH, "w") as f:
+                json.dump(self._entries, f)
+        except OSError as err:
+            logger.warning("Could not persist name cache: {err}", err=err)
+
+
+def _maybe_stat(path: Path | str) -> os.stat_result | None:
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def _flat_file_exists(name: str, gh_wf_index: dict[str, bool] | None) -> bool:
+    """Is `name` a regular file in `.github/workflows`?
+
+    Answered from the pre-scanned index when one is available (one readdir
+    for the whole run), falling back to a stat per query otherwise.
+    """
+    if gh_wf_index is not None:
+        return gh_wf_index.get(name, False)
+    st = _maybe_stat(os.path.join(GITHUB_WORKFLOWS_DIR_STR, name))
+    return st is not None and stat.S_ISREG(st.st_mode)
+
+
+def find_git_root(start_directory: str | None = None) -> Path:
+    # Plain string ancestor walk: one isdir probe per level, no materialized
+    # parents list and no Path allocation until the hit. The default is
+    # resolved lazily — a Path.cwd() default argument would be baked in at
+    # import time and go stale after any chdir.
+    directory = os.path.abspath(start_directory) if start_directory else os.getcwd()
+    origin = directory
+    while True:
+        if os.path.isdir(os.path.join(directory, ".git")):
+            return Path(directory)
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            raise FileNotFoundError(f"No git root found at or above '{origin}'")
+        directory = parent
+
+
+def generate_unified_diff(old_content: str, new_content: str, filename: str) -> str:
+    difflines = difflib.unified_diff(
+        old_content.splitlines(keepends=True),
+        new_content.splitlines(keepends=True),
+        fromfile=f"Old '{filename}'",
+        tofile=f"New '{filename}'",
+        # The interesting change is a single line; one context line is
+        # plenty and cuts the matcher's comparison work.
+        n=1,
+    )
+    # str.join consumes the generator directly; no list materialization.
+    return "".join(difflines).strip()
+
+
+def synthesize_name_diff(
+    old_content: bytes, new_content: bytes, match: re.Match[bytes] | None, filename: str
+) -> str:
+    """Unified diff for a name-line rewrite, without difflib.
+
+    The rewrite only ever replaces the `name:` line or prepends one, so the
+    single hunk is assembled directly from the match offsets instead of
+    re-deriving it with a full SequenceMatcher pass over both files. Any
+    input that does not fit that shape falls back to real difflib.
+    """
+    header = f"--- Old '{filename}'\n+++ New '{filename}'\n"
+    if match is None:
+        # A fresh name line was prepended; everything else is untouched.
+        first_line = new_content.split(b"\n", 1)[0].decode()
+        return f"{header}@@ -0,0 +1 @@\n+{first_line}"
+    start = match.start(1)
+    if old_content[:start] != new_content[:start]:
+        return generate_unified_diff(old_content.decode(), new_content.decode(), filename)
+    lineno = old_content.count(b"\n", 0, start) + 1
+    old_end = old_content.find(b"\n", start)
+    new_end = new_content.find(b"\n", start)
+    old_line = old_content[start : old_end if old_end != -1 else len(old_content)].decode()
+    new_line = new_content[start : new_end if new_end != -1 else len(new_content)].decode()
+    return f"{header}@@ -{lineno} +{lineno} @@\n-{old_line}\n+{new_line}"
+
+
+class WorkflowLink:
+    """A `workflow.yml` symlink under `Workflows/`.
+
+    The link's position in the tree is the single source of truth — the flat
+    filename, the link target and the workflow's `name:` key are all derived
+    from it (the "norm" values below) and fixed up when they disagree.
+
+    Deliberately not a PosixPath subclass: pathlib re-parses the path string
+    in `__new__` and every derived access (`.parent`, `.relative_to`, ...)
+    allocates more Path objects. The state here is one plain path string
+    plus the DirEntry from the scandir pass; everything else is derived with
+    str operations and plain os-level calls. `__slots__` keeps the fixed
+    fields out of the instance dict, which stays reserved for the cached
+    properties.
+    """
+
+    WORKFLOW_FILENAME = "workflow.yml"
+
+    __slots__ = ("_str", "_dirent", "__dict__")
+
+    def __init__(self, path: str, dirent: os.DirEntry[str] | None = None) -> None:
+        self._str = path
+        self._dirent = dirent
+
+    def __fspath__(self) -> str:
+        return self._str
+
+    def __str__(self) -> str:
+        return self._str
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._str!r})"
+
+    @classmethod
+    def find_workflow_links(cls, root: Path) -> Iterator["WorkflowLink"]:
+        """Recursively scan `root` for workflow links.
+
+        Uses `os.scandir` directly instead of `os.walk`: directory checks
+        come from the DirEntry's cached stat info, matches are tested inline
+        on the entry name, and instances are yielded without building any
+        intermediate filename lists. Directory symlinks are followed, but
+        each resolved (st_dev, st_ino) is entered at most once, so symlink
+        cycles terminate and shared subtrees are not re-scanned.
+        """
+        visited: set[tuple[int, int]] = set()
+
+        def _scan(path: str) -> Iterator["WorkflowLink"]:
+            try:
+                it = os.scandir(path)
+            except PermissionError:
+                return
+            with it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=True):
+                        # stat() is served from the DirEntry cache for plain
+                        # directories; only symlinked ones cost a syscall.
+                        st = entry.stat()
+                        key = (st.st_dev, st.st_ino)
+                        if key in visited:
+                            continue
+                        visited.add(key)
+                        yield from _scan(entry.path)
+                    elif entry.name == cls.WORKFLOW_FILENAME:
+                        # The DirEntry rides along so validation can reuse
+                        # its cached lstat instead of issuing another syscall.
+                        yield cls(entry.path, entry)
+
+        root_st = _maybe_stat(root)
+        if root_st is not None:
+            visited.add((root_st.st_dev, root_st.st_ino))
+        yield from _scan(str(root))
+
+    @functools.cached_property
+    def _norm_derivations(self) -> tuple[tuple[str, ...], str, str]:
+        """(subpath parts, wf_name_norm, wf_filename_norm), fused.
+
+        The expensive relative_to() runs once and all strings derived from
+        the same parts tuple are built together; the accessors below are
+        plain tuple reads.
+        """
+        # _str is always "<MY_WORKFLOWS_DIR>/<subpath...>/workflow.yml", so
+        # one split yields the subpath parts directly.
+        parts = tuple(self._str.split("/")[1:-1])
+        return parts, "/".join(parts), "--".join(parts) + ".yml"
+
+    @property
+    def _wf_name_norm_parts(self) -> tuple[str, ...]:
+        return self._norm_derivations[0]
+
+    @property
+    def wf_name_norm(self) -> str:
+        return self._norm_derivations[1]
+
+    @property
+    def wf_filename_norm(self) -> str:
+        return self._norm_derivations[2]
+
+    @functools.cached_property
+    def _wf_name_norm_bytes(self) -> bytes:
+        return self.wf_name_norm.encode()
+
+    @functools.cached_property
+    def wf_path_norm(self) -> PurePosixPath:
+        return GITHUB_WORKFLOWS_DIR / self.wf_filename_norm
+
+    @functools.cached_property
+    def _target_norm_str(self) -> str:
+        # The link sits at MY_WORKFLOWS_DIR/<parts...>/workflow.yml, so the
+        # climb back to the repo root is exactly len(parts) + 1 levels. That
+        # makes the relative target pure string arithmetic — no getcwd
+        # syscall and no relpath normalization.
+        climb = "../" * (len(self._wf_name_norm_parts) + 1)
+        return climb + GITHUB_WORKFLOWS_DIR_STR + "/" + self.wf_filename_norm
+
+    @staticmethod
+    def is_str_valid_wf_filename(s: str) -> bool:
+        return (
+            bool(s)
+            and s[0] in _WF_FILENAME_EDGE_CHARS
+            and s[-1] in _WF_FILENAME_EDGE_CHARS
+            and _WF_FILENAME_CHARS.issuperset(s)
+        )
+
+    def find_invalid_subpath_part(self) -> str | None:
+        """Return the first subpath part unusable in a flat filename, if any."""
+        # Fast path: validate all parts at once on the joined name.
+        if _WF_NAME_NORM_RE.match(self.wf_name_norm):
+            return None
+        # Something is off — re-check part by part to name the culprit.
+        for part in self._wf_name_norm_parts:
+            if not (
+                part
+                and part[0] in _WF_FILENAME_EDGE_CHARS
+                and part[-1] in _WF_FILENAME_EDGE_CHARS
+                and _WF_FILENAME_CHARS.issuperset(part)
+            ):
+                return part
+        return None
+
+    def plan_link_fixes(
+        self, gh_wf_index: dict[str, bool] | None = None
+    ) -> list[tuple[str, str, str]] | None:
+        """Validate the link and return the mutations it needs, unapplied.
+
+        Returns None for links that cannot be fixed, an empty list for
+        already-correct ones, and ("rename"|"relink", path, arg) actions
+        otherwise. Planning is read-only; `apply_link_fixes` executes the
+        collected actions for all links in one batched pass.
+        """
+        if _INFO_ENABLED:
+            logger.info("Processing '{wfl}'", wfl=self)
+
+        # The scandir pass already lstat'ed this entry — reject non-symlinks
+        # from its cached result without touching the filesystem again.
+        if self._dirent is not None and not self._dirent.is_symlink():
+            logger.warning("'{wfl}' is not a symlink, skipping", wfl=self)
+            return None
+
+        # One readlink and at most two stats up front; every check below
+        # branches on these locals instead of re-issuing syscalls through
+        # the is_symlink()/is_file() property chains.
+        try:
+            target_str = os.readlink(self)
+        except OSError:  # ENOENT or EINVAL: missing, or not a symlink
+            logger.warning("'{wfl}' is not a symlink, skipping", wfl=self)
+            return None
+
+        bad_part = self.find_invalid_subpath_part()
+        if bad_part is not None:
+            logger.warning("'{wfl}' has invalid subpath part '{part}'", wfl=self, part=bad_part)
+            return None
+
+        actions: list[tuple[str, str, str]] = []
+
+        target_name = os.path.basename(target_str)
+        wf_filename_norm = self.wf_filename_norm
+        if target_name == wf_filename_norm:
+            norm_exists = _flat_file_exists(target_name, gh_wf_index)
+        elif _flat_file_exists(target_name, gh_wf_index):
+            actions.append(
+                (
+                    "rename",
+                    os.path.join(GITHUB_WORKFLOWS_DIR_STR, target_name),
+                    os.fspath(self.wf_path_norm),
+                )
+            )
+            # Record the planned move so later exists-checks see post-state.
+            if gh_wf_index is not None:
+                gh_wf_index.pop(target_name, None)
+                gh_wf_index[wf_filename_norm] = True
+            norm_exists = True  # the rename will move the same inode
+        else:
+            norm_exists = _flat_file_exists(wf_filename_norm, gh_wf_index)
+
+        if not norm_exists:
+            logger.warning("Workflow file '{p}' does not exist", p=self.wf_path_norm)
+            return None
+
+        if target_str != self._target_norm_str:
+            actions.append(("relink", self._str, self._target_norm_str))
+
+        return actions
+
+    def _ensure_has_correct_name(self, name_cache: KnownGoodNameCache | None = None) -> None:
+        # Cheapest path first: an unmodified file whose name was confirmed on
+        # a previous run costs one stat and no read at all.
+        if name_cache is not None:
+            st = os.stat(self)
+            if name_cache.hit(st, self.wf_name_norm):
+                return
+
+        # Single pass over raw bytes on a bare fd: no TextIOWrapper, no
+        # BufferedRandom, no codec lookup — just read/lseek/write/ftruncate
+        # syscalls with the regex running directly on the bytes.
+        fd = os.open(self._str, os.O_RDWR)
+        name_re = _NAME_RE  # LOAD_FAST instead of a global lookup per search
+        try:
+            head = os.read(fd, 4096)
+            name_bytes = self._wf_name_norm_bytes
+
+            # Steady-state fast path: the name line sits in the first block
+            # and already matches — skip reading the rest of the file. A
+            # match butting against a full buffer may be truncated, so it
+            # falls through to the slow path.
+            match = name_re.search(head)
+            if (
+                match is not None
+                and (len(head) < 4096 or match.end(2) < len(head))
+                and head[match.start(2) : match.end(2)] == b'"%s"' % name_bytes
+            ):
+                if name_cache is not None:
+                    name_cache.record(st, self.wf_name_norm)
+                return
+
+            if len(head) < 4096:
+                old_content = head
+            else:
+                chunks = [head]
+                while chunk := os.read(fd, 65536):
+                    chunks.append(chunk)
+                old_content = b"".join(chunks)
+                match = name_re.search(old_content)
+
+            if match is None:
+                new_content = b'name: "%s"\n%s' % (name_bytes, old_content)
+            else:
+                # Splice around the matched value instead of running a second
+                # full regex pass with sub(); only the name line is rebuilt.
+                new_content = b'%s "%s"%s' % (
+                    old_content[: match.end(1)],
+                    name_bytes,
+                    old_content[match.end(2) :],
+                )
+
+            if new_content == old_content:
+                return
+
+            logger.info("Updating workflow name in '{p}'", p=self.wf_path_norm)
+            # Lazy: the diff is only assembled when a DEBUG sink actually
+            # consumes the record, and then from the match offsets rather
+            # than a difflib pass.
+            logger.opt(lazy=True).debug(
+                "Diff:\n{diff}",
+                diff=lambda: synthesize_name_diff(
+                    old_content, new_content, match, self.wf_filename_norm
+                ),
+            )
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.write(fd, new_content)
+            os.ftruncate(fd, len(new_content))
+        finally:
+            os.close(fd)
+        if name_cache is not None:
+            name_cache.record(os.stat(self), self.wf_name_norm)
+
+    @classmethod
+    def find_validate_and_fix_links(
+        cls, name_cache: KnownGoodNameCache | None = None
+    ) -> tuple[set[str], dict[str, bool]]:
+        """Process every link; return the valid-filename whitelist and the
+        (maintained) flat-directory index.
+
+        Runs in three phases: a serial planning pass over all links (cheap
+        — its exists-checks are answered from the in-memory index, and
+        serialization keeps the index's check-then-update consistent so two
+        links can never plan a rename of the same source), one batched
+        mutation pass grouped by directory, then the name check, which must
+        follow the mutations so its reads go through the final link targets
+        and which does carry real per-file I/O, hence the thread pool
+        there.
+        """
+        links = list(cls.find_workflow_links(MY_WORKFLOWS_DIR))
+        # Process siblings back-to-back: sorting by path keeps consecutive
+        # syscalls inside the same directory, so the kernel's dentry/inode
+        # caches stay hot instead of being thrashed by scan order.
+        links.sort(key=lambda link: link._str)
+        # One readdir of .github/workflows answers every exists-check below.
+        with os.scandir(GITHUB_WORKFLOWS_DIR_STR) as it:
+            gh_wf_index = {entry.name: entry.is_file() for entry in it}
+        valid_links: list[WorkflowLink] = []
+        actions: list[tuple[str, str, str]] = []
+        for workflow_link in links:
+            planned = workflow_link.plan_link_fixes(gh_wf_index)
+            if planned is None:
+                continue
+            valid_links.append(workflow_link)
+            actions.extend(planned)
+        apply_link_fixes(actions)
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            for _ in executor.map(
+                lambda link: link._ensure_has_correct_name(name_cache), valid_links
+            ):
+                pass
+        # Built in one comprehension (no per-add resize churn); the values
+        # are already memoized on the links.
+        whitelist = {link.wf_filename_norm for link in valid_links}
+        return whitelist, gh_wf_index
+
+
+def apply_link_fixes(actions: list[tuple[str, str, str]]) -> None:
+    """Execute planned renames/relinks in one batched pass.
+
+    Deferring the mutations out of the scan lets them be applied sorted by
+    containing directory: consecutive operations hit the same directory
+    inode, so its metadata/journal updates coalesce instead of being
+    interleaved across the tree — a real win on journaled and networked
+    filesystems.
+    """
+    actions.sort(key=lambda action: action[1].rsplit("/", 1)[0])
+    for op, path, arg in actions:
+        # A failed action (e.g. the tree changed under us between planning
+        # and apply) must not abort the batch: the remaining actions are
+        # independent and the name-check/cache-save phases still have to run.
+        try:
+            if op == "rename":
+                logger.info("Renaming '{src}' -> '{dst}'", src=path, dst=arg)
+                os.rename(path, arg)
+            else:  # relink
+                logger.info("Relinking '{lnk}' -> '{tgt}'", lnk=path, tgt=arg)
+                os.unlink(path)
+                os.symlink(arg, path)
+        except OSError as err:
+            logger.warning("Could not {op} '{p}': {err}", op=op, p=path, err=err)
+
+
+def create_new_symlinks(whitelist: set[str]) -> None:
+    """Create tree links for flat workflow files that do not have one yet."""
+    for wf_file in sorted(Path(GITHUB_WORKFLOWS_DIR_STR).iterdir()):
+        if wf_file.suffix != ".yml" or not wf_file.is_file() or wf_file.name in whitelist:
+            continue
+        parts = wf_file.name[: -len(".yml")].split("--")
+        link = Path(MY_WORKFLOWS_DIR.joinpath(*parts, WorkflowLink.WORKFLOW_FILENAME))
+        if link.is_symlink() or link.exists():
+            continue
+        link.parent.mkdir(parents=True, exist_ok=True)
+        target = Path(os.path.relpath(wf_file, start=link.parent))
+        logger.info("Creating link '{lnk}' -> '{tgt}'", lnk=link, tgt=target)
+        link.symlink_to(target)
+        whitelist.add(wf_file.name)
+
+
+def remove_bad_workflow_files(
+    whitelist: frozenset[str], gh_wf_index: dict[str, bool] | None = None
+) -> None:
+    """Remove flat `*.yml` files that no valid link maps to."""
+    def _remove(name: str, path: str) -> None:
+        if not name.endswith(".yml") or name in whitelist:
+            return
+        if PREVENT_UNLINK_UNRECOGNIZED_WORKFLOW_FILES:
+            logger.warning("Unrecognized workflow file '{f}' (unlink prevented)", f=path)
+        else:
+            logger.info("Removing unrecognized workflow file '{f}'", f=path)
+            # One failed removal must not abort the batch or skip the
+            # cache save.
+            try:
+                os.unlink(path)
+            except OSError as err:
+                logger.warning("Could not remove '{f}': {err}", f=path, err=err)
+
+    # The names come from the index maintained during validation when one is
+    # supplied, so the directory is not re-read; without one a single scandir
+    # streams the entries and the unlink takes entry.path straight off the
+    # DirEntry. Either way the regular-file check is already answered (index
+    # value / DirEntry-cached stat), so non-files — e.g. a directory with a
+    # .yml name — are skipped without a syscall.
+    if gh_wf_index is not None:
+        for name, is_file in list(gh_wf_index.items()):
+            if is_file:
+                _remove(name, os.path.join(GITHUB_WORKFLOWS_DIR_STR, name))
+    else:
+        with os.scandir(GITHUB_WORKFLOWS_DIR_STR) as it:
+            for entry in it:
+                if entry.is_file():
+                    _remove(entry.name, entry.path)
+
+
+def watch_workflow_links(name_cache: KnownGoodNameCache) -> int:
+    """Keep the tree in sync continuously instead of re-walking it per run.
+
+    Watches `Workflows/` for `workflow.yml` events and re-processes only the
+    affected link, so the steady-state cost of an edit is O(1) instead of a
+    full O(N) tree walk per invocation. Requires the optional `watchdog`
+    package.
+    """
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        logger.error("--watch requires the optional 'watchdog' package")
+        return 1
+
+    def _process(path: str) -> None:
+        if os.path.basename(path) != WorkflowLink.WORKFLOW_FILENAME:
+            return
+        link = WorkflowLink(os.path.relpath(path))
+        planned = link.plan_link_fixes()
+        if planned is None:
+            return
+        apply_link_fixes(planned)
+        link._ensure_has_correct_name(name_cache)
+        name_cache.save()
+
+    class _Handler(FileSystemEventHandler):
+        def on_created(self, event) -> None:
+            _process(event.src_path)
+
+        def on_modified(self, event) -> None:
+            _process(event.src_path)
+
+        def on_moved(self, event) -> None:
+            _process(event.dest_path)
+
+    observer = Observer()
+    observer.schedule(_Handler(), str(MY_WORKFLOWS_DIR), recursive=True)
+    observer.start()
+    logger.info("Watching '{dir}' for workflow link changes", dir=MY_WORKFLOWS_DIR)
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        observer.stop()
+    observer.join()
+    return 0
+
+
+def main() -> int:
+    # find_git_root walks ancestor strings of an already-absolute cwd, so
+    # the result needs no resolve(): that would lstat every component just
+    # to unfold symlinks nothing here depends on.
+    project_root_dir = find_git_root()
+    logger.info("Project root: '{root}'", root=project_root_dir)
+    os.chdir(project_root_dir)
+
+    name_cache = KnownGoodNameCache()
+    whitelist, gh_wf_index = WorkflowLink.find_validate_and_fix_links(name_cache)
+    create_new_symlinks(whitelist)
+    # Frozen at the boundary: the removal pass only reads it.
+    remove_bad_workflow_files(frozenset(whitelist), gh_wf_index)
+    name_cache.save()
+
+    if "--watch" in sys.argv[1:]:
+        return watch_workflow_links(name_cache)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
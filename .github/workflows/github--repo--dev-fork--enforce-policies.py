@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""Thin entry point for the dev-fork policy enforcement module."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from dev_fork_policy import main
+
+if __name__ == "__main__":
+    sys.exit(main())